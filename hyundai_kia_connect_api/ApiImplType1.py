@@ -1,6 +1,7 @@
 """ApiImplType1.py"""
 
 import datetime as dt
+import sys
 from typing import Optional
 
 from .ApiImpl import (
@@ -10,20 +11,202 @@ from .Token import Token
 from .Vehicle import Vehicle
 
 from .utils import (
-    get_child_value,
+    get_child_value_path,
     parse_datetime,
 )
 
 from .const import (
     DISTANCE_UNITS,
     ENGINE_TYPES,
+    LENGTH_KILOMETERS,
     SEAT_STATUS,
-    TEMPERATURE_UNITS,
+    TEMPERATURE_F,
 )
 
 USER_AGENT_OK_HTTP: str = "okhttp/3.12.0"
 
 
+# CCS2 0/1/2 states, 2 meaning off
+_TRISTATE = {0: False, 1: True, 2: False}
+
+
+def _minutes(value):
+    return value, "m"
+
+
+def _path(path: str) -> tuple:
+    # Path keys are interned so dict probes on the decoded state can match by identity.
+    return tuple(sys.intern(key) for key in path.split("."))
+
+
+def _split_paths(fields: tuple) -> tuple:
+    return tuple((name, _path(path), coerce) for name, path, coerce in fields)
+
+
+_ODOMETER_PATH = _path("Drivetrain.Odometer")
+_AIR_TEMPERATURE_PATH = _path("Cabin.HVAC.Row1.Driver.Temperature.Value")
+_DTE_TOTAL_PATH = _path("Drivetrain.FuelSystem.DTE.Total")
+_DTE_UNIT_PATH = _path("Drivetrain.FuelSystem.DTE.Unit")
+_TARGET_RANGE_AC_PATH = _path("Green.ChargingInformation.DTE.TargetSoC.Standard")
+_TARGET_RANGE_DC_PATH = _path("Green.ChargingInformation.DTE.TargetSoC.Quick")
+_LATITUDE_PATH = _path("Location.GeoCoord.Latitude")
+_LONGITUDE_PATH = _path("Location.GeoCoord.Longitude")
+_LOCATION_TIMESTAMP_PATH = _path("Location.TimeStamp")
+
+
+# (vehicle attribute, CCS2 state path, optional coerce function)
+_CCS2_FIELDS = _split_paths(
+    (
+        ("car_battery_percentage", "Electronics.Battery.Level", None),
+        ("engine_is_running", "DrivingReady", None),
+        ("defrost_is_on", "Body.Windshield.Front.Defog.State", _TRISTATE.get),
+        (
+            "steering_wheel_heater_is_on",
+            "Cabin.SteeringWheel.Heat.State",
+            _TRISTATE.get,
+        ),
+        ("back_window_heater_is_on", "Body.Windshield.Rear.Defog.State", _TRISTATE.get),
+        (
+            "front_left_seat_status",
+            "Cabin.Seat.Row1.Driver.Climate.State",
+            SEAT_STATUS.__getitem__,
+        ),
+        (
+            "front_right_seat_status",
+            "Cabin.Seat.Row1.Passenger.Climate.State",
+            SEAT_STATUS.__getitem__,
+        ),
+        (
+            "rear_left_seat_status",
+            "Cabin.Seat.Row2.Left.Climate.State",
+            SEAT_STATUS.__getitem__,
+        ),
+        (
+            "rear_right_seat_status",
+            "Cabin.Seat.Row2.Right.Climate.State",
+            SEAT_STATUS.__getitem__,
+        ),
+        ("hood_is_open", "Body.Hood.Open", None),
+        ("front_left_window_is_open", "Cabin.Window.Row1.Driver.Open", None),
+        ("front_right_window_is_open", "Cabin.Window.Row1.Passenger.Open", None),
+        ("back_left_window_is_open", "Cabin.Window.Row2.Left.Open", None),
+        ("back_right_window_is_open", "Cabin.Window.Row2.Right.Open", None),
+        (
+            "tire_pressure_rear_left_warning_is_on",
+            "Chassis.Axle.Row2.Left.Tire.PressureLow",
+            bool,
+        ),
+        (
+            "tire_pressure_front_left_warning_is_on",
+            "Chassis.Axle.Row1.Left.Tire.PressureLow",
+            bool,
+        ),
+        (
+            "tire_pressure_front_right_warning_is_on",
+            "Chassis.Axle.Row1.Right.Tire.PressureLow",
+            bool,
+        ),
+        (
+            "tire_pressure_rear_right_warning_is_on",
+            "Chassis.Axle.Row2.Right.Tire.PressureLow",
+            bool,
+        ),
+        (
+            "tire_pressure_all_warning_is_on",
+            "Chassis.Axle.Tire.PressureLow",
+            bool,
+        ),
+        ("trunk_is_open", "Body.Trunk.Open", None),
+        (
+            "ev_battery_percentage",
+            "Green.BatteryManagement.BatteryRemain.Ratio",
+            None,
+        ),
+        ("ev_battery_remain", "Green.BatteryManagement.BatteryRemain.Value", None),
+        (
+            "ev_battery_capacity",
+            "Green.BatteryManagement.BatteryCapacity.Value",
+            None,
+        ),
+        ("ev_battery_soh_percentage", "Green.BatteryManagement.SoH.Ratio", None),
+        (
+            "ev_battery_is_plugged_in",
+            "Green.ChargingInformation.ConnectorFastening.State",
+            None,
+        ),
+        ("ev_charge_port_door_is_open", "Green.ChargingDoor.State", _TRISTATE.get),
+        (
+            "washer_fluid_warning_is_on",
+            "Body.Windshield.Front.WasherFluid.LevelLow",
+            None,
+        ),
+        (
+            "ev_charge_limits_ac",
+            "Green.ChargingInformation.TargetSoC.Standard",
+            None,
+        ),
+        ("ev_charge_limits_dc", "Green.ChargingInformation.TargetSoC.Quick", None),
+        (
+            "ev_charging_current",
+            "Green.ChargingInformation.ElectricCurrentLevel.State",
+            None,
+        ),
+        (
+            "ev_v2l_discharge_limit",
+            "Green.Electric.SmartGrid.VehicleToLoad.DischargeLimitation.SoC",
+            None,
+        ),
+        (
+            "ev_first_departure_enabled",
+            "Green.Reservation.Departure.Schedule1.Enable",
+            bool,
+        ),
+        (
+            "ev_second_departure_enabled",
+            "Green.Reservation.Departure.Schedule2.Enable",
+            bool,
+        ),
+        ("brake_fluid_warning_is_on", "Chassis.Brake.Fluid.Warning", None),
+        ("fuel_level", "Drivetrain.FuelSystem.FuelLevel", None),
+        ("fuel_level_is_low", "Drivetrain.FuelSystem.LowFuelWarning", None),
+        ("air_control_is_on", "Cabin.HVAC.Row1.Driver.Blower.SpeedLevel", None),
+        ("smart_key_battery_warning_is_on", "Electronics.FOB.LowBattery", bool),
+        (
+            "ev_estimated_current_charge_duration",
+            "Green.ChargingInformation.Charging.RemainTime",
+            _minutes,
+        ),
+        (
+            "ev_estimated_fast_charge_duration",
+            "Green.ChargingInformation.EstimatedTime.Standard",
+            _minutes,
+        ),
+        (
+            "ev_estimated_portable_charge_duration",
+            "Green.ChargingInformation.EstimatedTime.ICCB",
+            _minutes,
+        ),
+        (
+            "ev_estimated_station_charge_duration",
+            "Green.ChargingInformation.EstimatedTime.Quick",
+            _minutes,
+        ),
+    )
+)
+
+# (vehicle attribute, CCS2 state path)
+# Kept apart from _CCS2_FIELDS so is_locked can be derived from the fetched values.
+_CCS2_DOOR_FIELDS = tuple(
+    (name, _path(path))
+    for name, path in (
+        ("front_left_door_is_open", "Cabin.Door.Row1.Driver.Open"),
+        ("front_right_door_is_open", "Cabin.Door.Row1.Passenger.Open"),
+        ("back_left_door_is_open", "Cabin.Door.Row2.Left.Open"),
+        ("back_right_door_is_open", "Cabin.Door.Row2.Right.Open"),
+    )
+)
+
+
 class ApiImplType1(ApiImpl):
     """ApiImplType1"""
 
@@ -47,157 +230,42 @@ class ApiImplType1(ApiImpl):
         }
 
     def _update_vehicle_properties_ccs2(self, vehicle: Vehicle, state: dict) -> None:
-        if get_child_value(state, "Date"):
-            vehicle.last_updated_at = parse_datetime(
-                get_child_value(state, "Date"), self.data_timezone
-            )
+        date = state.get("Date")
+        if date:
+            vehicle.last_updated_at = parse_datetime(date, self.data_timezone)
         else:
             vehicle.last_updated_at = dt.datetime.now(self.data_timezone)
 
         vehicle.odometer = (
-            get_child_value(state, "Drivetrain.Odometer"),
-            DISTANCE_UNITS[1],
+            get_child_value_path(state, _ODOMETER_PATH),
+            LENGTH_KILOMETERS,
         )
-        vehicle.car_battery_percentage = get_child_value(
-            state, "Electronics.Battery.Level"
-        )
-
-        vehicle.engine_is_running = get_child_value(state, "DrivingReady")
 
-        air_temp = get_child_value(
-            state,
-            "Cabin.HVAC.Row1.Driver.Temperature.Value",
-        )
+        air_temp = get_child_value_path(state, _AIR_TEMPERATURE_PATH)
 
         if air_temp != "OFF":
-            vehicle.air_temperature = (air_temp, TEMPERATURE_UNITS[1])
-
-        defrost_is_on = get_child_value(state, "Body.Windshield.Front.Defog.State")
-        if defrost_is_on in [0, 2]:
-            vehicle.defrost_is_on = False
-        elif defrost_is_on == 1:
-            vehicle.defrost_is_on = True
-
-        steer_wheel_heat = get_child_value(state, "Cabin.SteeringWheel.Heat.State")
-        if steer_wheel_heat in [0, 2]:
-            vehicle.steering_wheel_heater_is_on = False
-        elif steer_wheel_heat == 1:
-            vehicle.steering_wheel_heater_is_on = True
-
-        defrost_rear_is_on = get_child_value(state, "Body.Windshield.Rear.Defog.State")
-        if defrost_rear_is_on in [0, 2]:
-            vehicle.back_window_heater_is_on = False
-        elif defrost_rear_is_on == 1:
-            vehicle.back_window_heater_is_on = True
+            vehicle.air_temperature = (air_temp, TEMPERATURE_F)
 
         # TODO: status.sideMirrorHeat
-
-        vehicle.front_left_seat_status = SEAT_STATUS[
-            get_child_value(state, "Cabin.Seat.Row1.Driver.Climate.State")
-        ]
-
-        vehicle.front_right_seat_status = SEAT_STATUS[
-            get_child_value(state, "Cabin.Seat.Row1.Passenger.Climate.State")
-        ]
-
-        vehicle.rear_left_seat_status = SEAT_STATUS[
-            get_child_value(state, "Cabin.Seat.Row2.Left.Climate.State")
-        ]
-
-        vehicle.rear_right_seat_status = SEAT_STATUS[
-            get_child_value(state, "Cabin.Seat.Row2.Right.Climate.State")
-        ]
-
         # TODO: status.doorLock
 
-        vehicle.front_left_door_is_open = get_child_value(
-            state, "Cabin.Door.Row1.Driver.Open"
-        )
-        vehicle.front_right_door_is_open = get_child_value(
-            state, "Cabin.Door.Row1.Passenger.Open"
-        )
-        vehicle.back_left_door_is_open = get_child_value(
-            state, "Cabin.Door.Row2.Left.Open"
-        )
-        vehicle.back_right_door_is_open = get_child_value(
-            state, "Cabin.Door.Row2.Right.Open"
-        )
+        for name, path, coerce in _CCS2_FIELDS:
+            value = get_child_value_path(state, path)
+            setattr(vehicle, name, coerce(value) if coerce else value)
 
-        # TODO: should the windows and trunc also be checked?
-        vehicle.is_locked = not (
-            vehicle.front_left_door_is_open
-            or vehicle.front_right_door_is_open
-            or vehicle.back_left_door_is_open
-            or vehicle.back_right_door_is_open
-        )
+        door_is_open = False
+        for name, path in _CCS2_DOOR_FIELDS:
+            value = get_child_value_path(state, path)
+            setattr(vehicle, name, value)
+            door_is_open = door_is_open or value
 
-        vehicle.hood_is_open = get_child_value(state, "Body.Hood.Open")
-        vehicle.front_left_window_is_open = get_child_value(
-            state, "Cabin.Window.Row1.Driver.Open"
-        )
-        vehicle.front_right_window_is_open = get_child_value(
-            state, "Cabin.Window.Row1.Passenger.Open"
-        )
-        vehicle.back_left_window_is_open = get_child_value(
-            state, "Cabin.Window.Row2.Left.Open"
-        )
-        vehicle.back_right_window_is_open = get_child_value(
-            state, "Cabin.Window.Row2.Right.Open"
-        )
-        vehicle.tire_pressure_rear_left_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row2.Left.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_front_left_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row1.Left.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_front_right_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row1.Right.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_rear_right_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Row2.Right.Tire.PressureLow")
-        )
-        vehicle.tire_pressure_all_warning_is_on = bool(
-            get_child_value(state, "Chassis.Axle.Tire.PressureLow")
-        )
-        vehicle.trunk_is_open = get_child_value(state, "Body.Trunk.Open")
-
-        vehicle.ev_battery_percentage = get_child_value(
-            state, "Green.BatteryManagement.BatteryRemain.Ratio"
-        )
-        vehicle.ev_battery_remain = get_child_value(
-            state, "Green.BatteryManagement.BatteryRemain.Value"
-        )
-        vehicle.ev_battery_capacity = get_child_value(
-            state, "Green.BatteryManagement.BatteryCapacity.Value"
-        )
-        vehicle.ev_battery_soh_percentage = get_child_value(
-            state, "Green.BatteryManagement.SoH.Ratio"
-        )
-        vehicle.ev_battery_is_plugged_in = get_child_value(
-            state, "Green.ChargingInformation.ElectricCurrentLevel.State"
-        )
-        vehicle.ev_battery_is_plugged_in = get_child_value(
-            state, "Green.ChargingInformation.ConnectorFastening.State"
-        )
-        charging_door_state = get_child_value(state, "Green.ChargingDoor.State")
-        if charging_door_state in [0, 2]:
-            vehicle.ev_charge_port_door_is_open = False
-        elif charging_door_state == 1:
-            vehicle.ev_charge_port_door_is_open = True
+        # TODO: should the windows and trunc also be checked?
+        vehicle.is_locked = not door_is_open
 
+        dte_unit = DISTANCE_UNITS[get_child_value_path(state, _DTE_UNIT_PATH)]
         vehicle.total_driving_range = (
-            float(
-                get_child_value(
-                    state,
-                    "Drivetrain.FuelSystem.DTE.Total",  # noqa
-                )
-            ),
-            DISTANCE_UNITS[
-                get_child_value(
-                    state,
-                    "Drivetrain.FuelSystem.DTE.Unit",  # noqa
-                )
-            ],
+            float(get_child_value_path(state, _DTE_TOTAL_PATH)),
+            dte_unit,
         )
 
         if vehicle.engine_type == ENGINE_TYPES.EV:
@@ -208,68 +276,13 @@ class ApiImplType1(ApiImpl):
             )
         # TODO: vehicle.ev_driving_range for non EV
 
-        vehicle.washer_fluid_warning_is_on = get_child_value(
-            state, "Body.Windshield.Front.WasherFluid.LevelLow"
-        )
-
-        vehicle.ev_estimated_current_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.Charging.RemainTime"),
-            "m",
-        )
-        vehicle.ev_estimated_fast_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.Standard"),
-            "m",
-        )
-        vehicle.ev_estimated_portable_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.ICCB"),
-            "m",
-        )
-        vehicle.ev_estimated_station_charge_duration = (
-            get_child_value(state, "Green.ChargingInformation.EstimatedTime.Quick"),
-            "m",
-        )
-        vehicle.ev_charge_limits_ac = get_child_value(
-            state, "Green.ChargingInformation.TargetSoC.Standard"
-        )
-        vehicle.ev_charge_limits_dc = get_child_value(
-            state, "Green.ChargingInformation.TargetSoC.Quick"
-        )
-        vehicle.ev_charging_current = get_child_value(
-            state, "Green.ChargingInformation.ElectricCurrentLevel.State"
-        )
-        vehicle.ev_v2l_discharge_limit = get_child_value(
-            state, "Green.Electric.SmartGrid.VehicleToLoad.DischargeLimitation.SoC"
-        )
         vehicle.ev_target_range_charge_AC = (
-            get_child_value(
-                state,
-                "Green.ChargingInformation.DTE.TargetSoC.Standard",  # noqa
-            ),
-            DISTANCE_UNITS[
-                get_child_value(
-                    state,
-                    "Drivetrain.FuelSystem.DTE.Unit",  # noqa
-                )
-            ],
+            get_child_value_path(state, _TARGET_RANGE_AC_PATH),
+            dte_unit,
         )
         vehicle.ev_target_range_charge_DC = (
-            get_child_value(
-                state,
-                "Green.ChargingInformation.DTE.TargetSoC.Quick",  # noqa
-            ),
-            DISTANCE_UNITS[
-                get_child_value(
-                    state,
-                    "Drivetrain.FuelSystem.DTE.Unit",  # noqa
-                )
-            ],
-        )
-        vehicle.ev_first_departure_enabled = bool(
-            get_child_value(state, "Green.Reservation.Departure.Schedule1.Enable")
-        )
-
-        vehicle.ev_second_departure_enabled = bool(
-            get_child_value(state, "Green.Reservation.Departure.Schedule2.Enable")
+            get_child_value_path(state, _TARGET_RANGE_DC_PATH),
+            dte_unit,
         )
 
         # TODO: vehicle.ev_first_departure_days --> Green.Reservation.Departure.Schedule1.(Mon,Tue,Wed,Thu,Fri,Sat,Sun) # noqa
@@ -278,44 +291,28 @@ class ApiImplType1(ApiImpl):
         # TODO: vehicle.ev_second_departure_time --> Green.Reservation.Departure.Schedule2.(Min,Hour) # noqa
         # TODO: vehicle.ev_off_peak_charge_only_enabled --> unknown settings are in  --> Green.Reservation.OffPeakTime and OffPeakTime2 # noqa
 
-        vehicle.washer_fluid_warning_is_on = get_child_value(
-            state, "Body.Windshield.Front.WasherFluid.LevelLow"
-        )
-        vehicle.brake_fluid_warning_is_on = get_child_value(
-            state, "Chassis.Brake.Fluid.Warning"
-        )
-
-        vehicle.fuel_level = get_child_value(state, "Drivetrain.FuelSystem.FuelLevel")
-        vehicle.fuel_level_is_low = get_child_value(
-            state, "Drivetrain.FuelSystem.LowFuelWarning"
-        )
-        vehicle.air_control_is_on = get_child_value(
-            state, "Cabin.HVAC.Row1.Driver.Blower.SpeedLevel"
-        )
-        vehicle.smart_key_battery_warning_is_on = bool(
-            get_child_value(state, "Electronics.FOB.LowBattery")
-        )
-
-        if get_child_value(state, "Location.GeoCoord.Latitude"):
+        latitude = get_child_value_path(state, _LATITUDE_PATH)
+        if latitude:
             location_last_updated_at = dt.datetime(
                 2000, 1, 1, tzinfo=self.data_timezone
             )
-            timestamp = get_child_value(state, "Location.TimeStamp")
+            timestamp = get_child_value_path(state, _LOCATION_TIMESTAMP_PATH)
             if timestamp is not None:
                 location_last_updated_at = dt.datetime(
-                    year=int(get_child_value(timestamp, "Year")),
-                    month=int(get_child_value(timestamp, "Mon")),
-                    day=int(get_child_value(timestamp, "Day")),
-                    hour=int(get_child_value(timestamp, "Hour")),
-                    minute=int(get_child_value(timestamp, "Min")),
-                    second=int(get_child_value(timestamp, "Sec")),
+                    year=int(timestamp["Year"]),
+                    month=int(timestamp["Mon"]),
+                    day=int(timestamp["Day"]),
+                    hour=int(timestamp["Hour"]),
+                    minute=int(timestamp["Min"]),
+                    second=int(timestamp["Sec"]),
                     tzinfo=self.data_timezone,
                 )
 
             vehicle.location = (
-                get_child_value(state, "Location.GeoCoord.Latitude"),
-                get_child_value(state, "Location.GeoCoord.Longitude"),
+                latitude,
+                get_child_value_path(state, _LONGITUDE_PATH),
                 location_last_updated_at,
             )
 
-        vehicle.data = state
+        if vehicle.keep_raw:
+            vehicle.data = state
@@ -632,7 +632,8 @@ class KiaUvoApiCN(ApiImplType1):
                     get_child_value(state, "vehicleLocation.time"), self.data_timezone
                 ),
             )
-        vehicle.data = state
+        if vehicle.keep_raw:
+            vehicle.data = state
 
     def _update_vehicle_drive_info(self, vehicle: Vehicle, state: dict) -> None:
         vehicle.total_power_consumed = get_child_value(state, "totalPwrCsp")
@@ -542,7 +542,8 @@ class KiaUvoApiUSA(ApiImpl):
             state, "lastVehicleInfo.activeDTC.dtcCategory"
         )
 
-        vehicle.data = state
+        if vehicle.keep_raw:
+            vehicle.data = state
 
     def _get_cached_vehicle_state(self, token: Token, vehicle: Vehicle) -> dict:
         url = self.API_URL + "cmm/gvi"
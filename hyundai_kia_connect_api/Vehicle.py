@@ -1,9 +1,10 @@
 # pylint:disable=missing-class-docstring,missing-function-docstring,wildcard-import,unused-wildcard-import,invalid-name,logging-fstring-interpolation
 """Vehicle class"""
 
+from __future__ import annotations
+
 import logging
 import datetime
-import typing
 from dataclasses import dataclass, field
 
 from .utils import get_float, get_safe_local_datetime
@@ -12,7 +13,7 @@ from .const import DISTANCE_UNITS
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TripInfo:
     """Trip Info"""
 
@@ -24,7 +25,7 @@ class TripInfo:
     max_speed: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DayTripCounts:
     """Day trip counts"""
 
@@ -32,25 +33,25 @@ class DayTripCounts:
     trip_count: int = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthTripInfo:
     """Month Trip Info"""
 
     yyyymm: str = None
     summary: TripInfo = None
-    day_list: list[DayTripCounts] = field(default_factory=list)
+    day_list: list[DayTripCounts] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DayTripInfo:
     """Day Trip Info"""
 
     yyyymmdd: str = None
     summary: TripInfo = None
-    trip_list: list[TripInfo] = field(default_factory=list)
+    trip_list: list[TripInfo] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyDrivingStats:
     # energy stats are expressed in watthours (Wh)
     date: datetime.datetime = None
@@ -64,7 +65,7 @@ class DailyDrivingStats:
     distance_unit: str = DISTANCE_UNITS[1]  # set to kms by default
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     id: str = None
     name: str = None
@@ -96,8 +97,8 @@ class Vehicle:
     _last_updated_at: datetime.datetime = None
     timezone: datetime.timezone = datetime.timezone.utc  # default UTC
 
-    dtc_count: typing.Union[int, None] = None
-    dtc_descriptions: typing.Union[dict, None] = None
+    dtc_count: int | None = None
+    dtc_descriptions: dict | None = None
 
     smart_key_battery_warning_is_on: bool = None
     washer_fluid_warning_is_on: bool = None
@@ -117,6 +118,10 @@ class Vehicle:
     front_right_seat_status: str = None
     rear_left_seat_status: str = None
     rear_right_seat_status: str = None
+    front_left_seat_heater_is_on: bool = None
+    front_right_seat_heater_is_on: bool = None
+    rear_left_seat_heater_is_on: bool = None
+    rear_right_seat_heater_is_on: bool = None
 
     # Door Status
     is_locked: bool = None
@@ -155,15 +160,15 @@ class Vehicle:
 
     # EV fields (EV/PHEV)
 
-    ev_charge_port_door_is_open: typing.Union[bool, None] = None
-    ev_charging_power: typing.Union[float, None] = None  # Charging power in kW
+    ev_charge_port_door_is_open: bool | None = None
+    ev_charging_power: float | None = None  # Charging power in kW
 
-    ev_charge_limits_dc: typing.Union[int, None] = None
-    ev_charge_limits_ac: typing.Union[int, None] = None
-    ev_charging_current: typing.Union[int, None] = (
+    ev_charge_limits_dc: int | None = None
+    ev_charge_limits_ac: int | None = None
+    ev_charging_current: int | None = (
         None  # Europe feature only, ac charging current limit
     )
-    ev_v2l_discharge_limit: typing.Union[int, None] = None
+    ev_v2l_discharge_limit: int | None = None
 
     # energy consumed and regenerated since the vehicle was paired with the account
     # (so not necessarily for the vehicle's lifetime)
@@ -175,7 +180,7 @@ class Vehicle:
     power_consumption_30d: float = None  # Europe feature only
 
     # feature only available for some regions (getter/setter for sorting)
-    _daily_stats: list[DailyDrivingStats] = field(default_factory=list)
+    _daily_stats: list[DailyDrivingStats] | None = None
 
     @property
     def daily_stats(self):
@@ -201,9 +206,7 @@ class Vehicle:
     def month_trip_info(self, value):
         result = value
         if (
-            result is not None
-            and hasattr(result, "day_list")
-            and len(result.day_list) > 0
+            result is not None and hasattr(result, "day_list") and result.day_list
         ):  # sort on increasing yyyymmdd
             _LOGGER.debug(f"before month_trip_info: {result}")
             result.day_list.sort(key=lambda k: k.yyyymmdd)
@@ -221,9 +224,7 @@ class Vehicle:
     def day_trip_info(self, value):
         result = value
         if (
-            result is not None
-            and hasattr(result, "trip_list")
-            and len(result.trip_list) > 0
+            result is not None and hasattr(result, "trip_list") and result.trip_list
         ):  # sort on descending hhmmss
             _LOGGER.debug(f"before day_trip_info: {result}")
             result.trip_list.sort(reverse=True, key=lambda k: k.hhmmss)
@@ -257,42 +258,42 @@ class Vehicle:
     _ev_estimated_station_charge_duration_value: int = None
     _ev_estimated_station_charge_duration_unit: str = None
 
-    _ev_target_range_charge_AC: typing.Union[float, None] = None
-    _ev_target_range_charge_AC_value: typing.Union[float, None] = None
-    _ev_target_range_charge_AC_unit: typing.Union[str, None] = None
+    _ev_target_range_charge_AC: float | None = None
+    _ev_target_range_charge_AC_value: float | None = None
+    _ev_target_range_charge_AC_unit: str | None = None
 
-    _ev_target_range_charge_DC: typing.Union[float, None] = None
-    _ev_target_range_charge_DC_value: typing.Union[float, None] = None
-    _ev_target_range_charge_DC_unit: typing.Union[str, None] = None
+    _ev_target_range_charge_DC: float | None = None
+    _ev_target_range_charge_DC_value: float | None = None
+    _ev_target_range_charge_DC_unit: str | None = None
 
-    ev_first_departure_enabled: typing.Union[bool, None] = None
-    ev_second_departure_enabled: typing.Union[bool, None] = None
+    ev_first_departure_enabled: bool | None = None
+    ev_second_departure_enabled: bool | None = None
 
-    ev_first_departure_days: typing.Union[list, None] = None
-    ev_second_departure_days: typing.Union[list, None] = None
+    ev_first_departure_days: list | None = None
+    ev_second_departure_days: list | None = None
 
-    ev_first_departure_time: typing.Union[datetime.time, None] = None
-    ev_second_departure_time: typing.Union[datetime.time, None] = None
+    ev_first_departure_time: datetime.time | None = None
+    ev_second_departure_time: datetime.time | None = None
 
-    ev_first_departure_climate_enabled: typing.Union[bool, None] = None
-    ev_second_departure_climate_enabled: typing.Union[bool, None] = None
+    ev_first_departure_climate_enabled: bool | None = None
+    ev_second_departure_climate_enabled: bool | None = None
 
-    _ev_first_departure_climate_temperature: typing.Union[float, None] = None
-    _ev_first_departure_climate_temperature_value: typing.Union[float, None] = None
-    _ev_first_departure_climate_temperature_unit: typing.Union[str, None] = None
+    _ev_first_departure_climate_temperature: float | None = None
+    _ev_first_departure_climate_temperature_value: float | None = None
+    _ev_first_departure_climate_temperature_unit: str | None = None
 
-    _ev_second_departure_climate_temperature: typing.Union[float, None] = None
-    _ev_second_departure_climate_temperature_value: typing.Union[float, None] = None
-    _ev_second_departure_climate_temperature_unit: typing.Union[str, None] = None
+    _ev_second_departure_climate_temperature: float | None = None
+    _ev_second_departure_climate_temperature_value: float | None = None
+    _ev_second_departure_climate_temperature_unit: str | None = None
 
-    ev_first_departure_climate_defrost: typing.Union[bool, None] = None
-    ev_second_departure_climate_defrost: typing.Union[bool, None] = None
+    ev_first_departure_climate_defrost: bool | None = None
+    ev_second_departure_climate_defrost: bool | None = None
 
-    ev_off_peak_start_time: typing.Union[datetime.time, None] = None
-    ev_off_peak_end_time: typing.Union[datetime.time, None] = None
-    ev_off_peak_charge_only_enabled: typing.Union[bool, None] = None
+    ev_off_peak_start_time: datetime.time | None = None
+    ev_off_peak_end_time: datetime.time | None = None
+    ev_off_peak_charge_only_enabled: bool | None = None
 
-    ev_schedule_charge_enabled: typing.Union[bool, None] = None
+    ev_schedule_charge_enabled: bool | None = None
 
     # IC fields (PHEV/HEV/IC)
     _fuel_driving_range: float = None
@@ -307,6 +308,9 @@ class Vehicle:
 
     # Debug fields
     data: dict = None
+    # Set to False to not retain the raw state payload on data. Ignored by the
+    # Hyundai USA and Canada backends, which read their state back from data.
+    keep_raw: bool = field(default=True, repr=False, compare=False)
 
     @property
     def geocode(self):
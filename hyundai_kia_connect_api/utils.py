@@ -18,6 +18,16 @@ def get_child_value(data, key):
     return value
 
 
+def get_child_value_path(data, path: tuple):
+    """Like get_child_value, for a pre-split tuple of dict keys."""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, TypeError):
+            return None
+    return data
+
+
 def get_float(value):
     if value is None:
         return None
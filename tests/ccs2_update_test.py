@@ -0,0 +1,176 @@
+import datetime
+
+from hyundai_kia_connect_api.ApiImplType1 import ApiImplType1
+from hyundai_kia_connect_api.Vehicle import Vehicle
+from hyundai_kia_connect_api.const import ENGINE_TYPES
+
+
+STATE = {
+    "Date": "20241001123456",
+    "DrivingReady": 0,
+    "Drivetrain": {
+        "Odometer": 12345.6,
+        "FuelSystem": {
+            "DTE": {"Total": 321, "Unit": 1},
+            "FuelLevel": 0,
+            "LowFuelWarning": 0,
+        },
+    },
+    "Electronics": {"Battery": {"Level": 88}, "FOB": {"LowBattery": 0}},
+    "Cabin": {
+        "HVAC": {
+            "Row1": {
+                "Driver": {
+                    "Temperature": {"Value": "22.5"},
+                    "Blower": {"SpeedLevel": 0},
+                }
+            }
+        },
+        "SteeringWheel": {"Heat": {"State": 1}},
+        "Seat": {
+            "Row1": {
+                "Driver": {"Climate": {"State": 6}},
+                "Passenger": {"Climate": {"State": 0}},
+            },
+            "Row2": {
+                "Left": {"Climate": {"State": 2}},
+                "Right": {"Climate": {"State": 1}},
+            },
+        },
+        "Door": {
+            "Row1": {"Driver": {"Open": 0}, "Passenger": {"Open": 0}},
+            "Row2": {"Left": {"Open": 0}, "Right": {"Open": 1}},
+        },
+        "Window": {
+            "Row1": {"Driver": {"Open": 0}, "Passenger": {"Open": 1}},
+            "Row2": {"Left": {"Open": 0}, "Right": {"Open": 0}},
+        },
+    },
+    "Body": {
+        "Windshield": {
+            "Front": {"Defog": {"State": 2}, "WasherFluid": {"LevelLow": 1}},
+            "Rear": {"Defog": {"State": 0}},
+        },
+        "Hood": {"Open": 0},
+        "Trunk": {"Open": 1},
+    },
+    "Chassis": {
+        "Axle": {
+            "Row1": {
+                "Left": {"Tire": {"PressureLow": 0}},
+                "Right": {"Tire": {"PressureLow": 1}},
+            },
+            "Row2": {
+                "Left": {"Tire": {"PressureLow": 0}},
+                "Right": {"Tire": {"PressureLow": 0}},
+            },
+            "Tire": {"PressureLow": 1},
+        },
+        "Brake": {"Fluid": {"Warning": 0}},
+    },
+    "Green": {
+        "BatteryManagement": {
+            "BatteryRemain": {"Ratio": 76, "Value": 58000},
+            "BatteryCapacity": {"Value": 77400},
+            "SoH": {"Ratio": 99},
+        },
+        "ChargingInformation": {
+            "ElectricCurrentLevel": {"State": 3},
+            "ConnectorFastening": {"State": 1},
+            "Charging": {"RemainTime": 95},
+            "EstimatedTime": {"Standard": 410, "ICCB": 1800, "Quick": 42},
+            "TargetSoC": {"Standard": 80, "Quick": 90},
+            "DTE": {"TargetSoC": {"Standard": 390, "Quick": 430}},
+        },
+        "ChargingDoor": {"State": 1},
+        "Electric": {
+            "SmartGrid": {
+                "VehicleToLoad": {"DischargeLimitation": {"SoC": 20}},
+            }
+        },
+        "Reservation": {
+            "Departure": {"Schedule1": {"Enable": 1}, "Schedule2": {"Enable": 0}}
+        },
+    },
+    "Location": {
+        "GeoCoord": {"Latitude": 52.1, "Longitude": 5.2},
+        "TimeStamp": {
+            "Year": 2024,
+            "Mon": 10,
+            "Day": 1,
+            "Hour": 12,
+            "Min": 30,
+            "Sec": 15,
+        },
+    },
+}
+
+
+def _update(state: dict, engine_type=ENGINE_TYPES.EV, **vehicle_kwargs) -> Vehicle:
+    api = ApiImplType1()
+    api.data_timezone = datetime.timezone.utc
+    vehicle = Vehicle(engine_type=engine_type, **vehicle_kwargs)
+    api._update_vehicle_properties_ccs2(vehicle, state)
+    return vehicle
+
+
+def test_update_vehicle_properties_ccs2():
+    vehicle = _update(STATE)
+
+    assert vehicle.odometer == 12345.6
+    assert vehicle.odometer_unit == "km"
+    assert vehicle.car_battery_percentage == 88
+    assert vehicle.air_temperature == "22.5"
+    assert vehicle.defrost_is_on is False
+    assert vehicle.steering_wheel_heater_is_on is True
+    assert vehicle.back_window_heater_is_on is False
+    assert vehicle.front_left_seat_status == "Low Heat"
+    assert vehicle.rear_right_seat_status == "On"
+    assert vehicle.back_right_door_is_open == 1
+    assert vehicle.is_locked is False
+    assert vehicle.trunk_is_open == 1
+    assert vehicle.front_right_window_is_open == 1
+    assert vehicle.tire_pressure_front_right_warning_is_on is True
+    assert vehicle.tire_pressure_rear_left_warning_is_on is False
+    assert vehicle.tire_pressure_all_warning_is_on is True
+    assert vehicle.ev_battery_percentage == 76
+    assert vehicle.ev_battery_is_plugged_in == 1
+    assert vehicle.ev_charging_current == 3
+    assert vehicle.ev_charge_port_door_is_open is True
+    assert vehicle.total_driving_range == 321.0
+    assert vehicle.total_driving_range_unit == "km"
+    assert vehicle.ev_driving_range == 321.0
+    assert vehicle.ev_target_range_charge_AC == 390
+    assert vehicle.ev_target_range_charge_DC_unit == "km"
+    assert vehicle.ev_estimated_fast_charge_duration == 410
+    assert vehicle.ev_first_departure_enabled is True
+    assert vehicle.ev_second_departure_enabled is False
+    assert vehicle.washer_fluid_warning_is_on == 1
+    assert vehicle.smart_key_battery_warning_is_on is False
+    assert vehicle.location == (5.2, 52.1)
+    assert vehicle.location_last_updated_at == datetime.datetime(
+        2024, 10, 1, 12, 30, 15, tzinfo=datetime.timezone.utc
+    )
+    assert vehicle.data is STATE
+
+
+def test_update_vehicle_properties_ccs2_all_doors_closed():
+    state = dict(STATE)
+    state["Cabin"] = dict(
+        STATE["Cabin"],
+        Door={
+            "Row1": {"Driver": {"Open": 0}, "Passenger": {"Open": 0}},
+            "Row2": {"Left": {"Open": 0}, "Right": {"Open": 0}},
+        },
+    )
+    vehicle = _update(state, engine_type=ENGINE_TYPES.ICE)
+
+    assert vehicle.is_locked is True
+    assert vehicle.ev_driving_range is None
+
+
+def test_update_vehicle_properties_ccs2_without_raw_state():
+    vehicle = _update(STATE, keep_raw=False)
+
+    assert vehicle.data is None
+    assert vehicle.odometer == 12345.6